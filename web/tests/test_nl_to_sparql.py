@@ -0,0 +1,48 @@
+"""Tests for the data-modifying keyword guard in wobd_web.nl_to_sparql."""
+
+import pytest
+
+from wobd_web.nl_to_sparql import _StreamGuard, _validate_query
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "DELETE{?s ?p ?o} WHERE {?s ?p ?o}",
+        "INSERT{<http://example.org/s> ?p ?o} WHERE {?s ?p ?o}",
+        "LOAD<http://example.org/data.ttl>",
+        "drop graph <http://example.org/g>",
+    ],
+)
+def test_validate_query_rejects_update_syntax(query):
+    with pytest.raises(RuntimeError, match="forbidden"):
+        _validate_query(query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT ?update WHERE { ?s schema:dateUpdated ?update }",
+        "SELECT $delete WHERE { ?s <http://example.org/load> ?delete }",
+    ],
+)
+def test_validate_query_allows_variables_and_names(query):
+    assert _validate_query(query).endswith(query)
+
+
+def _feed_all(deltas):
+    guard = _StreamGuard()
+    for delta in deltas:
+        error = guard.feed(delta)
+        if error is not None:
+            return error
+    return None
+
+
+def test_stream_guard_catches_keyword_split_across_deltas():
+    assert _feed_all(["SELECT * {} ; DEL", "ETE", "{?s ?p ?o}"]) is not None
+
+
+def test_stream_guard_allows_prefixed_names_split_across_deltas():
+    deltas = ["SELECT ?", "upd", "ate WHERE { ?s schema:date", "Updated ?update }\n"]
+    assert _feed_all(deltas) is None
@@ -0,0 +1,68 @@
+"""Tests for wobd_web.sparql.client."""
+
+from wobd_web.sparql.client import SourceResult, _parse_sparql_json, ensure_limit
+
+
+def test_ensure_limit_appends_when_missing():
+    assert ensure_limit("SELECT * WHERE {?s ?p ?o}", 3) == "SELECT * WHERE {?s ?p ?o}\nLIMIT 3"
+
+
+def test_ensure_limit_replaces_existing_limit_and_keeps_offset():
+    query = "SELECT * WHERE {?s ?p ?o} LIMIT 10 OFFSET 20;"
+    assert ensure_limit(query, 3) == "SELECT * WHERE {?s ?p ?o} LIMIT 3 OFFSET 20"
+
+
+def test_ensure_limit_replaces_limit_followed_by_comments():
+    query = "SELECT * WHERE {?s ?p ?o} LIMIT 10 # note"
+    assert ensure_limit(query, 3) == "SELECT * WHERE {?s ?p ?o} LIMIT 3 # note"
+
+    query = "SELECT * WHERE {?s ?p ?o}\nLIMIT 10\n# first\n  # second\n"
+    result = ensure_limit(query, 3)
+    assert result.lower().count("limit") == 1
+    assert result.startswith("SELECT * WHERE {?s ?p ?o}\nLIMIT 3\n# first")
+
+
+def test_ensure_limit_ignores_subquery_limit():
+    query = "SELECT * WHERE { { SELECT ?s WHERE { ?s ?p ?o } LIMIT 5 } } # note"
+    assert ensure_limit(query, 3) == f"{query}\nLIMIT 3"
+
+
+def test_ensure_limit_ignores_limit_inside_trailing_comment():
+    query = "SELECT * WHERE {?s ?p ?o}\n# was LIMIT 10"
+    assert ensure_limit(query, 3) == f"{query}\nLIMIT 3"
+
+
+def test_ensure_limit_does_not_treat_iri_fragment_as_comment():
+    query = "SELECT * WHERE {?s a <http://example.org/ns#Dataset>} LIMIT 10"
+    assert ensure_limit(query, 3) == "SELECT * WHERE {?s a <http://example.org/ns#Dataset>} LIMIT 3"
+
+
+def test_columnar_results_round_trip_to_rows():
+    payload = {
+        "head": {"vars": ["s", "label"]},
+        "results": {
+            "bindings": [
+                {"s": {"type": "uri", "value": "http://example.org/a"}},
+                {
+                    "s": {"type": "uri", "value": "http://example.org/b"},
+                    "label": {"type": "literal", "value": "B"},
+                },
+            ]
+        },
+    }
+    rows, variables = _parse_sparql_json(payload)
+    columns, _ = _parse_sparql_json(payload, columnar=True)
+    assert columns == {
+        "s": ["http://example.org/a", "http://example.org/b"],
+        "label": [None, "B"],
+    }
+    result = SourceResult(
+        rows=[],
+        variables=variables,
+        row_count=2,
+        elapsed_ms=0.0,
+        endpoint_url="http://example.org/sparql",
+        status="ok",
+        columns=columns,
+    )
+    assert result.to_rows() == rows
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Callable, Dict, List, Optional, TypedDict
 
 import yaml
 
@@ -24,11 +24,25 @@ class UIConfig:
     max_rows: int = 200
 
 
+@dataclass
+class SemanticCacheConfig:
+    enabled: bool = False
+    embedding_model: str = "text-embedding-3-small"
+    threshold: float = 0.92
+    ttl_s: float = 86400.0
+    max_entries: int = 2048
+    path: Optional[str] = None
+
+
 @dataclass
 class LLMConfig:
     provider: str = "openai"
     model: str = "gpt-4.1"
     temperature: float = 0.1
+    # Client-side throttle and SDK retry budget for OpenAI requests.
+    requests_per_minute: int = 500
+    max_retries: int = 5
+    semantic_cache: SemanticCacheConfig = field(default_factory=SemanticCacheConfig)
 
 
 @dataclass
@@ -48,17 +62,15 @@ class ConfigError(RuntimeError):
     """Raised when the WOBD web configuration is missing or invalid."""
 
 
-def _default_config_path() -> Path:
-    """
-    Determine the default local config path.
+# Resolved once at import, relative to the `web/` directory, so it works both
+# when run via `streamlit run web/app.py` and when imported as a package.
+_DEFAULT_CONFIG_PATH: Path = Path(__file__).resolve().parents[1] / "configs" / "demo.local.yaml"
 
-    This is resolved relative to the `web/` directory so it works both when run
-    via `streamlit run web/app.py` and when imported as a package.
-    """
 
-    here = Path(__file__).resolve()
-    web_root = here.parents[1]  # .../web
-    return web_root / "configs" / "demo.local.yaml"
+def _default_config_path() -> Path:
+    """Return the default local config path (`web/configs/demo.local.yaml`)."""
+
+    return _DEFAULT_CONFIG_PATH
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
@@ -116,6 +128,20 @@ def _coerce_ui(section: Any) -> UIConfig:
     )
 
 
+def _coerce_semantic_cache(section: Any) -> SemanticCacheConfig:
+    if not isinstance(section, dict):
+        return SemanticCacheConfig()
+    path = section.get("path")
+    return SemanticCacheConfig(
+        enabled=bool(section.get("enabled", False)),
+        embedding_model=str(section.get("embedding_model", "text-embedding-3-small")),
+        threshold=float(section.get("threshold", 0.92)),
+        ttl_s=float(section.get("ttl_s", 86400.0)),
+        max_entries=int(section.get("max_entries", 2048)),
+        path=str(path) if path else None,
+    )
+
+
 def _coerce_llm(section: Any) -> LLMConfig:
     if not isinstance(section, dict):
         return LLMConfig()
@@ -123,11 +149,29 @@ def _coerce_llm(section: Any) -> LLMConfig:
         provider=str(section.get("provider", "openai")),
         model=str(section.get("model", "gpt-4.1")),
         temperature=float(section.get("temperature", 0.1)),
+        requests_per_minute=int(section.get("requests_per_minute", 500)),
+        max_retries=int(section.get("max_retries", 5)),
+        semantic_cache=_coerce_semantic_cache(section.get("semantic_cache")),
     )
 
 
 _CACHED_CONFIG: Optional[AppConfig] = None
 
+# Callables invoked after `load_config(force_reload=True)` rebuilds the config,
+# e.g. `cache_clear` of memoized helpers whose results depend on config values.
+_RELOAD_HOOKS: List[Callable[[], None]] = []
+
+
+def register_reload_hook(hook: Callable[[], None]) -> Callable[[], None]:
+    """
+    Register a callable to run whenever the configuration is force-reloaded.
+
+    Returns the hook unchanged so this can also be used as a decorator.
+    """
+
+    _RELOAD_HOOKS.append(hook)
+    return hook
+
 
 def load_config(force_reload: bool = False) -> AppConfig:
     """
@@ -201,6 +245,9 @@ def load_config(force_reload: bool = False) -> AppConfig:
         ui=ui_cfg,
         llm=llm_cfg,
     )
+    if force_reload:
+        for hook in _RELOAD_HOOKS:
+            hook()
     return _CACHED_CONFIG
 
 
@@ -244,9 +291,11 @@ __all__ = [
     "AppConfig",
     "UIConfig",
     "LLMConfig",
+    "SemanticCacheConfig",
     "EndpointConfig",
     "ConfigError",
     "load_config",
+    "register_reload_hook",
     "get_nde_endpoints",
     "get_frink_endpoints_or_none",
     "get_wikidata_endpoints_or_none",
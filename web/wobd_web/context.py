@@ -31,5 +31,23 @@ def load_nde_context() :  # -> Dict[str, Any]:
     return data if isinstance(data, dict) else {}
 
 
-__all__ = ["load_nde_context"]
+@lru_cache()
+def load_nde_context_snippet(max_chars: int) -> str:
+    """
+    Return at most `max_chars` characters from the start of the NDE context file.
+
+    Only the head of the file is read; the JSON is not parsed. The file is
+    written pretty-printed (`json.dumps(..., indent=2)`) by
+    `scripts/build_nde_context.py`, so the head is already a readable excerpt.
+    Returns an empty string if the file is missing or unreadable.
+    """
+
+    try:
+        with _NDE_CONTEXT_PATH.open("r", encoding="utf-8") as f:
+            return f.read(max_chars)
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+__all__ = ["load_nde_context", "load_nde_context_snippet"]
 
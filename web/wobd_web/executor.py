@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from typing import Dict, List, Set
+import re
+from typing import Any, Dict, List, Mapping
 
 from wobd_web.config import load_config
 from wobd_web.gene_expression.service import get_gene_expression_service
 from wobd_web.models import AnswerBundle, ProvenanceItem, QueryPlan, SourceAction
-from wobd_web.nl_to_sparql import TargetKind, generate_sparql
+from wobd_web.nl_to_sparql import TargetKind, generate_sparql, generate_sparql_many
 from wobd_web.preset_queries import (
-    TOCILIZUMAB_STEP2_NDE_TEMPLATE,
-    TOCILIZUMAB_STEP3_METADATA_TEMPLATE,
     get_preset_query,
+    render_tocilizumab_step2,
+    render_tocilizumab_step3,
 )
-from wobd_web.sparql.client import SourceResult, ensure_limit, execute_sparql
+from wobd_web.sparql.cache import cached_execute
+from wobd_web.sparql.client import SourceResult, ensure_limit
 from wobd_web.sparql.endpoints import (
     Endpoint,
     get_default_frink_endpoint,
@@ -23,6 +25,27 @@ from wobd_web.sparql.endpoints import (
 )
 
 
+# Matches a MONDO identifier as returned by Wikidata (P5270): either a bare
+# numeric id, a "MONDO:"-prefixed id, or an already-expanded IRI.
+_MONDO_ID_RE = re.compile(r"^(?:MONDO:)?(?:(http\S+)|(\d+))$")
+_MONDO_IRI_PREFIX = "http://purl.obolibrary.org/obo/MONDO_"
+
+
+def _mondo_uri_for_row(row: Mapping[str, Any]) -> str | None:
+    """Return the MONDO IRI for a Wikidata drug→disease row, if any."""
+
+    uri = row.get("mondo_uri")
+    if uri:
+        return uri
+    mondo_id = row.get("mondo_id")
+    if not mondo_id:
+        return None
+    m = _MONDO_ID_RE.match(str(mondo_id).strip())
+    if m is None:
+        return None
+    return m.group(1) or f"{_MONDO_IRI_PREFIX}{m.group(2)}"
+
+
 def _target_for_action(action: SourceAction) -> TargetKind:
     if action.kind == "gene_expression":
         return "gene_expression"
@@ -74,9 +97,22 @@ def _replace_endpoint_placeholders(sparql: str) -> str:
     return query
 
 
-def _run_single_action(action: SourceAction, max_rows: int, apply_limit: bool = True) -> tuple[SourceResult, str, ProvenanceItem]:
-    cfg = load_config()
-    
+def _run_single_action(
+    action: SourceAction,
+    max_rows: int,
+    apply_limit: bool = True,
+    query_text_override: str | None = None,
+    generated_sparql: str | None = None,
+) -> tuple[SourceResult, str, ProvenanceItem]:
+    """
+    Run a single action and return its result, executed SPARQL and provenance.
+
+    For non-preset actions, `query_text_override` (typically the user's
+    question) is used as the NL prompt instead of `action.query_text`, so the
+    plan itself is never mutated. `generated_sparql` may carry SPARQL already
+    generated for that prompt, in which case the LLM is not called.
+    """
+
     # Check if this is a preset query (raw SPARQL) or needs NL→SPARQL generation
     if _is_preset_query(action.query_text):
         # Preset query - use SPARQL directly, but replace endpoint placeholders if present
@@ -87,11 +123,16 @@ def _run_single_action(action: SourceAction, max_rows: int, apply_limit: bool =
         target = _target_for_action(action)
         # Only apply limit if requested and not a preset query
         limit_for_llm = max_rows if apply_limit else None
-        sparql = generate_sparql(
-            question=action.query_text,
-            target=target,
-            interactive_limit=limit_for_llm,
-        )
+        question = query_text_override if query_text_override is not None else action.query_text
+        if generated_sparql is not None:
+            sparql = generated_sparql
+        else:
+            # generate_sparql caches by (target, question), so repeats skip the LLM.
+            sparql = generate_sparql(
+                question=question,
+                target=target,
+                interactive_limit=limit_for_llm,
+            )
         # Also ensure LIMIT is in the generated query if needed
         if apply_limit:
             sparql = ensure_limit(sparql, max_rows)
@@ -112,10 +153,10 @@ def _run_single_action(action: SourceAction, max_rows: int, apply_limit: bool =
                 error="Wikidata endpoint not configured.",
             )
         else:
-            result = execute_sparql(endpoint.sparql_url, sparql)
+            result = cached_execute(endpoint.sparql_url, sparql)
     elif action.kind == "nde":
         endpoint = get_default_nde_endpoint()
-        result = execute_sparql(endpoint.sparql_url, sparql)
+        result = cached_execute(endpoint.sparql_url, sparql)
     elif action.kind == "frink":
         endpoint = get_default_frink_endpoint()
         if endpoint is None:
@@ -129,7 +170,7 @@ def _run_single_action(action: SourceAction, max_rows: int, apply_limit: bool =
                 error="FRINK endpoint not configured.",
             )
         else:
-            result = execute_sparql(endpoint.sparql_url, sparql)
+            result = cached_execute(endpoint.sparql_url, sparql)
     else:  # gene_expression
         # Gene expression may use a non-SPARQL adapter.
         endpoint = get_gene_expr_endpoint_for_mode("sparql")
@@ -184,24 +225,16 @@ def _execute_multistep_query(plan: QueryPlan, question: str, apply_limit: bool =
         provenance.append(prov1)
         
         # Extract MONDO URIs from step 1 results
-        mondo_uris: Set[str] = set()
-        for row in result1.rows:
-            if "mondo_uri" in row and row["mondo_uri"]:
-                mondo_uris.add(row["mondo_uri"])
-            elif "mondo_id" in row and row["mondo_id"]:
-                # Convert MONDO ID to URI format
-                mondo_id = str(row["mondo_id"]).strip()
-                if mondo_id.startswith("MONDO:"):
-                    mondo_id = mondo_id.replace("MONDO:", "")
-                if mondo_id.startswith("http"):
-                    mondo_uris.add(mondo_id)
-                else:
-                    mondo_uris.add(f"http://purl.obolibrary.org/obo/MONDO_{mondo_id}")
+        # dict.fromkeys dedups while keeping first-seen order, so the generated
+        # VALUES block (and thus the query text) is deterministic.
+        mondo_uris: Dict[str, None] = dict.fromkeys(
+            uri for uri in map(_mondo_uri_for_row, result1.rows) if uri
+        )
         
         # Step 2: Query NDE with MONDO identifiers
         if mondo_uris:
             mondo_values = "\n    ".join(f"<{uri}>" for uri in mondo_uris)
-            step2_query = TOCILIZUMAB_STEP2_NDE_TEMPLATE.replace("{MONDO_VALUES}", mondo_values)
+            step2_query = render_tocilizumab_step2(mondo_values)
             
             step2_action = SourceAction(
                 source_id="nde_datasets_by_mondo",
@@ -215,14 +248,13 @@ def _execute_multistep_query(plan: QueryPlan, question: str, apply_limit: bool =
             provenance.append(prov2)
             
             # Step 3: Query sample metadata for each dataset
-            dataset_uris: Set[str] = set()
-            for row in result2.rows:
-                if "study" in row and row["study"]:
-                    dataset_uris.add(str(row["study"]))
+            dataset_uris: Dict[str, None] = dict.fromkeys(
+                str(row["study"]) for row in result2.rows if row.get("study")
+            )
             
             if dataset_uris:
                 study_values = "\n    ".join(f"<{uri}>" for uri in dataset_uris)
-                step3_query = TOCILIZUMAB_STEP3_METADATA_TEMPLATE.replace("{STUDY_VALUES}", study_values)
+                step3_query = render_tocilizumab_step3(study_values)
                 
                 step3_action = SourceAction(
                     source_id="sample_metadata",
@@ -278,7 +310,10 @@ def run_plan(plan: QueryPlan, question: str, apply_limit: bool = True) -> Answer
     preset = get_preset_query(question)
     if preset and preset.query_type == "multistep":
         return _execute_multistep_query(plan, question, apply_limit=apply_limit)
-    
+
+    if not plan.actions:
+        return AnswerBundle(final_text="No results.", tables={}, sparql_texts={}, provenance=[])
+
     # Single-step execution (original behavior)
     cfg = load_config()
     max_rows = cfg.ui.max_rows
@@ -294,13 +329,32 @@ def run_plan(plan: QueryPlan, question: str, apply_limit: bool = True) -> Answer
     provenance: List[ProvenanceItem] = []
     limit_was_applied = False
 
-    for action in plan.actions:
-        # Track if this is a preset query before processing
-        is_preset = _is_preset_query(action.query_text)
+    # Track which actions are preset queries before processing
+    preset_flags = [_is_preset_query(action.query_text) for action in plan.actions]
+
+    # When several actions need NL→SPARQL (e.g. NDE + gene expression), generate
+    # their queries concurrently rather than one LLM round trip after another.
+    limit_for_llm = max_rows if apply_limit else None
+    nl_targets = [
+        _target_for_action(action)
+        for action, is_preset in zip(plan.actions, preset_flags)
+        if not is_preset
+    ]
+    pregenerated = iter(
+        generate_sparql_many([(question, target, limit_for_llm) for target in nl_targets])
+        if len(nl_targets) > 1
+        else []
+    )
+
+    for action, is_preset in zip(plan.actions, preset_flags):
         # For non-preset queries, use the original question as the prompt
-        if not is_preset:
-            action.query_text = question
-        result, sparql, prov = _run_single_action(action, max_rows=max_rows, apply_limit=apply_limit)
+        result, sparql, prov = _run_single_action(
+            action,
+            max_rows=max_rows,
+            apply_limit=apply_limit,
+            query_text_override=None if is_preset else question,
+            generated_sparql=None if is_preset else next(pregenerated, None),
+        )
         tables[action.source_id] = result.rows
         sparql_texts[action.source_id] = sparql
         provenance.append(prov)
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol, runtime_checkable
+from typing import Dict, Protocol
 
 from wobd_web.sparql.client import SourceResult, execute_sparql
 from wobd_web.sparql.endpoints import get_gene_expr_endpoint_for_mode
 
 
-@runtime_checkable
 class GeneExpressionService(Protocol):
     """Minimal interface for gene expression querying."""
 
@@ -78,21 +77,28 @@ class LocalGeneExpressionService:
         )
 
 
+# The services hold no per-call state, so one shared instance per mode suffices.
+_SPARQL = SparqlGeneExpressionService(mode="sparql")
+_WEBMCP = WebMCPGeneExpressionService()
+_LOCAL = LocalGeneExpressionService()
+
+_SERVICES_BY_MODE: Dict[str, GeneExpressionService] = {
+    "web_mcp": _WEBMCP,
+    "local": _LOCAL,
+}
+
+
 def get_gene_expression_service(mode: str) -> GeneExpressionService:
     """
-    Factory returning a GeneExpressionService for the requested mode.
+    Return the shared GeneExpressionService for the requested mode.
 
     Modes:
-    - "sparql": use configured SPARQL endpoint.
+    - "sparql": use configured SPARQL endpoint (also the fallback).
     - "web_mcp": placeholder Web-MCP adapter.
     - "local": placeholder local adapter.
     """
 
-    if mode == "web_mcp":
-        return WebMCPGeneExpressionService()
-    if mode == "local":
-        return LocalGeneExpressionService()
-    return SparqlGeneExpressionService(mode="sparql")
+    return _SERVICES_BY_MODE.get(mode, _SPARQL)
 
 
 __all__ = [
@@ -0,0 +1,23 @@
+"""
+Connection settings shared by the app's httpx clients (OpenAI and SPARQL).
+"""
+
+from __future__ import annotations
+
+import httpx
+
+try:  # HTTP/2 needs the optional h2 package (pip install "wobd-web[speedups]").
+    import h2  # noqa: F401
+except ImportError:
+    HTTP2 = False
+else:
+    HTTP2 = True
+
+
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+__all__ = [
+    "HTTP2",
+    "HTTP_LIMITS",
+]
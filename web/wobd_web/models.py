@@ -1,12 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional
+import json
+import math
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
+try:  # Optional fast JSON encoder (pip install "wobd-web[speedups]").
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SourceAction:
-    """A single query action against a configured source."""
+    """A single query action against a configured source (immutable)."""
 
     source_id: str
     kind: Literal["nde", "frink", "gene_expression"]
@@ -14,11 +21,11 @@ class SourceAction:
     mode: Literal["interactive", "batch"] = "interactive"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QueryPlan:
-    """A collection of source actions to execute for one user question."""
+    """A collection of source actions to execute for one user question (immutable)."""
 
-    actions: List[SourceAction] = field(default_factory=list)
+    actions: Tuple[SourceAction, ...] = ()
 
 
 @dataclass
@@ -53,10 +60,45 @@ class AnswerBundle:
     limit_value: Optional[int] = None
 
 
+def _finite(value: Any) -> Any:
+    # Replace NaN/Infinity with None, as orjson does.
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+def bundle_to_json(bundle: AnswerBundle) -> bytes:
+    """
+    Serialize an AnswerBundle (including tables and provenance) to JSON bytes.
+
+    Uses orjson when installed, which serializes dataclasses natively and is
+    considerably faster on large result tables; otherwise falls back to the
+    stdlib encoder. Both emit compact UTF-8 JSON that decodes to the same
+    values, with NaN and infinities written as null. The bytes can still
+    differ in float formatting (orjson writes `1e-7` where the stdlib
+    writes `1e-07`).
+    """
+
+    if orjson is not None:
+        return orjson.dumps(bundle)
+    data = asdict(bundle)
+    try:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    except ValueError:
+        # Rare: a non-finite float somewhere in the tables.
+        text = json.dumps(_finite(data), ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
 __all__ = [
     "SourceAction",
     "QueryPlan",
     "ProvenanceItem",
     "AnswerBundle",
+    "bundle_to_json",
 ]
 
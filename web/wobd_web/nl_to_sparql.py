@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-from typing import Literal, Optional
-
-from openai import OpenAI
-
-from wobd_web.config import LLMConfig, load_config
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, cast
+
+import httpx
+import numpy as np
+from openai import AsyncOpenAI, DefaultHttpxClient, OpenAI, OpenAIError
+
+from wobd_web.config import LLMConfig, load_config, register_reload_hook
+from wobd_web.http_settings import HTTP2, HTTP_LIMITS
 from wobd_web.sparql.client import ensure_limit
-from wobd_web.context import load_nde_context
+from wobd_web.context import load_nde_context_snippet
+from wobd_web.nl_to_sparql_cache import (
+    ExactSPARQLCache,
+    SemanticSPARQLCache,
+    normalize_embedding,
+)
 
 
 TargetKind = Literal["nde", "gene_expression"]
@@ -19,6 +34,23 @@ PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
 """
 
 
+# Data-modifying SPARQL keywords rejected in generated queries. Matched as
+# whole words, with punctuation counting as a delimiter (so DELETE{ is
+# caught), but not as part of a variable, prefixed name or IRI path such as
+# ?update, schema:dateUpdated or <http://example.org/load>.
+_FORBIDDEN_KEYWORDS = frozenset({"insert", "delete", "update", "load", "drop"})
+_FORBIDDEN_RE = re.compile(
+    r"(?<![\w?$:/#-])(?:" + "|".join(sorted(_FORBIDDEN_KEYWORDS)) + r")(?![\w:-])",
+    re.IGNORECASE,
+)
+# Trailing run of characters that may still extend a word in streamed text.
+_TRAILING_WORD_RE = re.compile(r"[\w:-]*\Z")
+_PREFIX_SCHEMA_RE = re.compile(r"prefix\s+schema:", re.IGNORECASE)
+_PREFIX_RDF_RE = re.compile(r"prefix\s+rdf:", re.IGNORECASE)
+# PREFIX declarations must precede the query body, so only the head is scanned.
+_PREFIX_SCAN_CHARS = 1024
+
+
 # Module-level storage for OpenAI API key (set by app.py)
 _OPENAI_API_KEY: Optional[str] = None
 
@@ -29,39 +61,198 @@ def set_openai_api_key(api_key: str) -> None:
     _OPENAI_API_KEY = api_key
 
 
-def _get_client_and_model() -> tuple[OpenAI, LLMConfig]:
-    cfg = load_config()
+# Upper bound on in-flight LLM requests when fanning out concurrently.
+MAX_CONCURRENT_REQUESTS = 32
+
+SparqlRequest = Tuple[str, TargetKind, Optional[int]]
+
+
+def _get_api_key() -> str:
     # Use module-level key if set (from Streamlit secrets), otherwise fall back to environment variable
     api_key = _OPENAI_API_KEY or os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError(
             "OPENAI_API_KEY is not set. Please provide an API key to enable NL→SPARQL."
         )
-    client = OpenAI(api_key=api_key)
-    return client, cfg.llm
+    return api_key
+
+
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    """
+    Connection pool shared by all sync OpenAI clients.
+
+    Keeps TCP/TLS connections to the API alive between requests and, when h2
+    is installed, multiplexes concurrent requests over HTTP/2.
+    """
+
+    return DefaultHttpxClient(http2=HTTP2, limits=HTTP_LIMITS)
+
+
+@lru_cache(maxsize=None)
+def _client_for_key(api_key: str, max_retries: int) -> OpenAI:
+    """
+    Return a shared OpenAI client per API key (clients are thread-safe).
+
+    The SDK retries rate-limit (429) and transient server errors itself, with
+    jittered exponential backoff that honours Retry-After headers.
+    """
+
+    return OpenAI(api_key=api_key, max_retries=max_retries, http_client=_http_client())
+
+
+def _get_client_and_model() -> tuple[OpenAI, LLMConfig]:
+    llm_cfg = load_config().llm
+    return _client_for_key(_get_api_key(), llm_cfg.max_retries), llm_cfg
+
+
+class _RateLimiter:
+    """
+    Process-wide token bucket for LLM requests.
+
+    Callers reserve a token and sleep for the returned delay, so the bucket
+    works from threads and from any event loop alike.
+    """
+
+    def __init__(self, requests_per_minute: int) -> None:
+        self._rate = max(requests_per_minute, 1) / 60.0
+        # Allow short bursts of up to one second's worth of requests.
+        self._capacity = max(self._rate, 1.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    def wait(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def await_turn(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@lru_cache(maxsize=1)
+def _get_rate_limiter() -> _RateLimiter:
+    return _RateLimiter(load_config().llm.requests_per_minute)
+
+
+register_reload_hook(_get_rate_limiter.cache_clear)
+
+
+# Exact-text cache checked before any network call; cleared on config reload
+# since the LLM model/temperature may have changed.
+_EXACT_CACHE = ExactSPARQLCache(maxsize=2048)
+register_reload_hook(_EXACT_CACHE.clear)
+
+
+@lru_cache(maxsize=1)
+def _get_semantic_cache() -> Optional[SemanticSPARQLCache]:
+    """Return the process-wide semantic cache, or None if disabled in config."""
+
+    cache_cfg = load_config().llm.semantic_cache
+    if not cache_cfg.enabled:
+        return None
+    return SemanticSPARQLCache(
+        threshold=cache_cfg.threshold,
+        ttl_s=cache_cfg.ttl_s,
+        max_entries=cache_cfg.max_entries,
+        path=Path(cache_cfg.path).expanduser() if cache_cfg.path else None,
+    )
+
+
+@register_reload_hook
+def _flush_semantic_cache() -> None:
+    # Persist pending entries before the instance is dropped below.
+    if _get_semantic_cache.cache_info().currsize:
+        cache = _get_semantic_cache()
+        if cache is not None:
+            cache.flush()
 
 
+register_reload_hook(_get_semantic_cache.cache_clear)
+
+
+def _embed_question(client: OpenAI, llm_cfg: LLMConfig, question: str) -> Optional[np.ndarray]:
+    """Embed a question for semantic cache lookup; None if the call fails."""
+
+    try:
+        resp = client.embeddings.create(
+            model=llm_cfg.semantic_cache.embedding_model,
+            input=question,
+        )
+    except OpenAIError:
+        return None
+    return normalize_embedding(resp.data[0].embedding)
+
+
+def _embed_questions(questions: Sequence[str], llm_cfg: LLMConfig) -> Optional[List[np.ndarray]]:
+    """
+    Embed several questions in one request for the semantic cache.
+
+    Returns None if the semantic cache is disabled, there is nothing to embed,
+    or the call fails.
+    """
+
+    if not questions or _get_semantic_cache() is None:
+        return None
+    client = _client_for_key(_get_api_key(), llm_cfg.max_retries)
+    try:
+        resp = client.embeddings.create(
+            model=llm_cfg.semantic_cache.embedding_model,
+            input=list(questions),
+        )
+    except OpenAIError:
+        return None
+    ordered = sorted(resp.data, key=lambda item: item.index)
+    return [normalize_embedding(item.embedding) for item in ordered]
+
+
+async def _aembed_question(
+    client: AsyncOpenAI, llm_cfg: LLMConfig, question: str
+) -> Optional[np.ndarray]:
+    """Async counterpart of `_embed_question`."""
+
+    try:
+        resp = await client.embeddings.create(
+            model=llm_cfg.semantic_cache.embedding_model,
+            input=question,
+        )
+    except OpenAIError:
+        return None
+    return normalize_embedding(resp.data[0].embedding)
+
+
+@lru_cache()
 def _build_nde_context_hint() -> str:
     """
     Build a small textual hint from the NDE context JSON, if available.
 
     The NDE context file `nde_global.json` can be large; we include only a
     truncated pretty-printed snippet to give the LLM some idea of the schema
-    without overwhelming the prompt. If the file is missing or cannot be
-    parsed, this returns an empty string.
+    without overwhelming the prompt. Only the head of the file is read (it is
+    stored pretty-printed), so the JSON is never fully parsed. If the file is
+    missing or unreadable, this returns an empty string. The result is
+    computed once per process.
     """
 
-    ctx = load_nde_context()
-    if not ctx:
-        return ""
-
-    try:
-        snippet = json.dumps(ctx, indent=2)
-    except Exception:
-        return ""
-
     # Truncate to keep prompts reasonably sized.
     max_len = 2000
+    snippet = load_nde_context_snippet(max_len + 1)
+    if not snippet.strip():
+        return ""
+
     if len(snippet) > max_len:
         snippet = snippet[: max_len - 40] + "\n... (context truncated) ..."
 
@@ -72,36 +263,43 @@ def _build_nde_context_hint() -> str:
     )
 
 
+# Complete system prompts, assembled once at import. Static text comes first
+# and the (larger) NDE context hint last, so requests share the longest
+# possible prefix for OpenAI's automatic prompt caching.
+_SYSTEM_PROMPT_BASE = (
+    "You are an expert SPARQL query generator. "
+    "Given a natural-language question, you produce a single SPARQL SELECT "
+    "query that can be executed directly against the target endpoint. "
+    "You MUST only output the SPARQL query, with no explanation or commentary. "
+    "The query MUST NOT modify data (no INSERT, DELETE, UPDATE, LOAD, or DROP). "
+    "ALWAYS include PREFIX declarations at the top of the query such as:\n"
+    "PREFIX schema: <http://schema.org/>\n"
+    "PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>\n"
+    "If you use any additional prefixes, declare them as well.\n"
+    "Use explicit variable names."
+)
+_SYSTEM_PROMPT_NDE = (
+    _SYSTEM_PROMPT_BASE
+    + " The target is an NDE knowledge graph. In this graph, studies are "
+    "represented as schema:Dataset resources (not schema:Study). Use "
+    "schema:infectiousAgent to link datasets to pathogens or diseases, "
+    "schema:includedInDataCatalog to see which catalog a dataset belongs to, "
+    "and schema:name for human-readable labels."
+    + _build_nde_context_hint()
+)
+_SYSTEM_PROMPT_GENE_EXPRESSION = (
+    _SYSTEM_PROMPT_BASE
+    + " The target is a gene expression dataset. Focus on genes, samples, "
+    "conditions, and expression values."
+)
+_SYSTEM_PROMPTS: Dict[str, str] = {
+    "nde": _SYSTEM_PROMPT_NDE,
+    "gene_expression": _SYSTEM_PROMPT_GENE_EXPRESSION,
+}
+
+
 def _build_system_prompt(target: TargetKind) -> str:
-    base = (
-        "You are an expert SPARQL query generator. "
-        "Given a natural-language question, you produce a single SPARQL SELECT "
-        "query that can be executed directly against the target endpoint. "
-        "You MUST only output the SPARQL query, with no explanation or commentary. "
-        "The query MUST NOT modify data (no INSERT, DELETE, UPDATE, LOAD, or DROP). "
-        "ALWAYS include PREFIX declarations at the top of the query such as:\n"
-        "PREFIX schema: <http://schema.org/>\n"
-        "PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>\n"
-        "If you use any additional prefixes, declare them as well.\n"
-        "Use explicit variable names."
-    )
-    if target == "nde":
-        return (
-            base
-            + " The target is an NDE knowledge graph. In this graph, studies are "
-            "represented as schema:Dataset resources (not schema:Study). Use "
-            "schema:infectiousAgent to link datasets to pathogens or diseases, "
-            "schema:includedInDataCatalog to see which catalog a dataset belongs to, "
-            "and schema:name for human-readable labels."
-            + _build_nde_context_hint()
-        )
-    if target == "gene_expression":
-        return (
-            base
-            + " The target is a gene expression dataset. Focus on genes, samples, "
-            "conditions, and expression values."
-        )
-    return base
+    return _SYSTEM_PROMPTS.get(target, _SYSTEM_PROMPT_BASE)
 
 
 def _add_prefixes_if_missing(query: str) -> str:
@@ -111,68 +309,375 @@ def _add_prefixes_if_missing(query: str) -> str:
     If the model already emitted them, avoid duplicating.
     """
 
-    normalized = query.lower()
-    if "prefix schema:" in normalized and "prefix rdf:" in normalized:
+    head = min(len(query), _PREFIX_SCAN_CHARS)
+    if _PREFIX_SCHEMA_RE.search(query, 0, head) and _PREFIX_RDF_RE.search(query, 0, head):
         return query
     return f"{PREFIX_BLOCK}\n{query.lstrip()}"
 
 
-def generate_sparql(
-    question: str,
-    target: TargetKind,
-    interactive_limit: int | None = None,
-) -> str:
-    """
-    Use OpenAI to generate a SPARQL SELECT query for the given target.
+def _apply_limit(query: str, interactive_limit: int | None) -> str:
+    if interactive_limit is not None:
+        return ensure_limit(query, interactive_limit)
+    return query
 
-    The generated query is post-processed to ensure a LIMIT clause is present
-    for interactive usage, unless interactive_limit is None.
-    """
 
-    client, llm_cfg = _get_client_and_model()
-    system_prompt = _build_system_prompt(target)
+def _semantic_lookup(target: TargetKind, embedding: Optional[np.ndarray]) -> Optional[str]:
+    semantic_cache = _get_semantic_cache()
+    if semantic_cache is None or embedding is None:
+        return None
+    # Hits are not copied into the exact cache: that has no TTL, and a near
+    # match (e.g. mouse "Dusp2" vs human "DUSP2") must expire with its entry.
+    return semantic_cache.lookup(target, embedding)
 
-    completion = client.responses.create(  # type: ignore[attr-defined]
-        model=llm_cfg.model,
-        input=[
+
+def _response_request(
+    question: str,
+    target: TargetKind,
+    llm_cfg: LLMConfig,
+    system_suffix: str = "",
+) -> Dict[str, Any]:
+    """Keyword arguments for `responses.create`, shared by sync and async paths."""
+
+    return {
+        "model": llm_cfg.model,
+        "input": [
             {
                 "role": "system",
-                "content": system_prompt,
+                "content": _build_system_prompt(target) + system_suffix,
             },
             {
                 "role": "user",
                 "content": question,
             },
         ],
-        temperature=llm_cfg.temperature,
+        "temperature": llm_cfg.temperature,
+    }
+
+
+def _output_text(completion: Any) -> str:
+    """Concatenate the output text segments of a Responses API result."""
+
+    # The Responses API can return content in segments; join the stripped,
+    # non-empty output_text segments in a single pass.
+    return "\n".join(
+        text
+        for output in completion.output  # type: ignore[union-attr]
+        for item in getattr(output, "content", None) or ()
+        if getattr(item, "type", None) == "output_text"
+        for text in ((getattr(item, "text", "") or "").strip(),)
+        if text
     )
 
-    # The Responses API can return content in segments; this helper extracts text.
-    text_chunks: list[str] = []
-    for output in completion.output:  # type: ignore[union-attr]
-        for item in getattr(output, "content", []) or []:
-            if getattr(item, "type", None) == "output_text":
-                text_chunks.append(getattr(item, "text", "") or "")
 
-    query = "\n".join(chunk.strip() for chunk in text_chunks if chunk.strip())
+def _query_from_completion(completion: Any) -> str:
+    """Extract, validate and prefix the SPARQL text of a Responses API result."""
+
+    return _validate_query(_output_text(completion))
+
+
+def _validate_query(query: str) -> str:
+    """Reject empty or data-modifying queries and add missing standard prefixes."""
+
     if not query:
         raise RuntimeError("LLM did not return a SPARQL query.")
 
     # Enforce SELECT-only by a simple guard; callers can choose how strict to be.
-    lowered = query.lower()
-    forbidden = ("insert", "delete", "update", "load", "drop")
-    if any(f" {kw} " in lowered for kw in forbidden):
-        raise RuntimeError("Generated query appears to contain forbidden SPARQL operations.")
+    if _FORBIDDEN_RE.search(query):
+        raise _forbidden_error(query)
 
-    query_with_prefixes = _add_prefixes_if_missing(query)
-    if interactive_limit is not None:
-        return ensure_limit(query_with_prefixes, interactive_limit)
-    return query_with_prefixes
+    return _add_prefixes_if_missing(query)
+
+
+def _forbidden_error(text: str) -> RuntimeError:
+    found = sorted({m.group(0).upper() for m in _FORBIDDEN_RE.finditer(text)})
+    return RuntimeError(
+        "Generated query appears to contain forbidden SPARQL operations: "
+        + ", ".join(found)
+    )
+
+
+class _StreamGuard:
+    """
+    Scan streamed output text for forbidden keywords as it arrives.
+
+    Text is scanned up to the last word delimiter seen, since a keyword only
+    counts as a whole word and the current trailing word may still be
+    growing; each region is scanned once.
+    """
+
+    __slots__ = ("text", "scanned")
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.scanned = 0
+
+    def feed(self, delta: str) -> Optional[RuntimeError]:
+        """Append `delta`; return the error to raise if a keyword appeared."""
+
+        start = len(self.text)
+        self.text += delta
+        trailing = _TRAILING_WORD_RE.search(delta)
+        if trailing is None or trailing.start() == 0:
+            # No delimiter in this delta, so no word has been completed.
+            return None
+        end = start + trailing.start()
+        if _FORBIDDEN_RE.search(self.text, self.scanned, end):
+            return _forbidden_error(self.text[:end])
+        self.scanned = end
+        return None
+
+
+def _stream_completion(client: OpenAI, request: Dict[str, Any]) -> Any:
+    """
+    Run a Responses API request as a stream and return the final response.
+
+    Output text is checked for forbidden keywords as it arrives, so a
+    data-modifying query aborts the request (and stops token generation)
+    instead of being rejected only after the full completion.
+    """
+
+    guard = _StreamGuard()
+    with client.responses.stream(**request) as stream:  # type: ignore[attr-defined]
+        for event in stream:
+            if event.type != "response.output_text.delta":
+                continue
+            error = guard.feed(event.delta)
+            if error is not None:
+                stream.close()
+                raise error
+        return stream.get_final_response()
+
+
+async def _astream_completion(client: AsyncOpenAI, request: Dict[str, Any]) -> Any:
+    """Async counterpart of `_stream_completion`."""
+
+    guard = _StreamGuard()
+    async with client.responses.stream(**request) as stream:  # type: ignore[attr-defined]
+        async for event in stream:
+            if event.type != "response.output_text.delta":
+                continue
+            error = guard.feed(event.delta)
+            if error is not None:
+                await stream.close()
+                raise error
+        return await stream.get_final_response()
+
+
+def _remember(
+    question: str,
+    target: TargetKind,
+    query: str,
+    embedding: Optional[np.ndarray],
+) -> None:
+    _EXACT_CACHE.put(target, question, query)
+    semantic_cache = _get_semantic_cache()
+    if semantic_cache is not None and embedding is not None:
+        semantic_cache.add(target, question, embedding, query)
+
+
+def generate_sparql(
+    question: str,
+    target: TargetKind,
+    interactive_limit: int | None = None,
+) -> str:
+    """
+    Use OpenAI to generate a SPARQL SELECT query for the given target.
+
+    The generated query is post-processed to ensure a LIMIT clause is present
+    for interactive usage, unless interactive_limit is None.
+
+    Previously generated SPARQL is reused without an LLM call when the same
+    question (up to whitespace) was asked for the same
+    target, or, if the semantic cache is enabled in config, when a
+    sufficiently similar question was.
+    """
+
+    cached = _EXACT_CACHE.get(target, question)
+    if cached is not None:
+        return _apply_limit(cached, interactive_limit)
+
+    client, llm_cfg = _get_client_and_model()
+
+    embedding = None
+    if _get_semantic_cache() is not None:
+        embedding = _embed_question(client, llm_cfg, question)
+        cached = _semantic_lookup(target, embedding)
+        if cached is not None:
+            return _apply_limit(cached, interactive_limit)
+
+    _get_rate_limiter().wait()
+    completion = _stream_completion(client, _response_request(question, target, llm_cfg))
+    query = _query_from_completion(completion)
+    _remember(question, target, query, embedding)
+    return _apply_limit(query, interactive_limit)
+
+
+_BATCH_SYSTEM_SUFFIX = (
+    "\nYou will be given a numbered list of questions instead of a single one. "
+    "Respond with a JSON array of strings containing exactly one SPARQL query "
+    "per question, in the same order, and nothing else."
+)
+
+
+def _queries_from_batch_completion(completion: Any, expected: int) -> List[str]:
+    """Parse and validate the JSON array of SPARQL strings from a batch request."""
+
+    text = _output_text(completion)
+    # Tolerate a Markdown code fence around the JSON array.
+    if text.startswith("```"):
+        text = text.strip("`").removeprefix("json").strip()
+    try:
+        queries = json.loads(text)
+    except ValueError as exc:
+        raise RuntimeError(f"LLM did not return a JSON array of SPARQL queries: {exc}") from exc
+    if (
+        not isinstance(queries, list)
+        or len(queries) != expected
+        or not all(isinstance(q, str) for q in queries)
+    ):
+        raise RuntimeError(
+            f"LLM returned a malformed batch: expected {expected} SPARQL strings."
+        )
+    return [_validate_query(q.strip()) for q in queries]
+
+
+def generate_sparql_batch(
+    questions: Sequence[Tuple[str, TargetKind]],
+    interactive_limit: int | None = None,
+) -> List[str]:
+    """
+    Generate SPARQL for several (question, target) pairs with one LLM request
+    per distinct target instead of one per question.
+
+    Questions already in the exact-match cache are not sent. Results are
+    returned in input order and share the caches and post-processing of
+    `generate_sparql`.
+    """
+
+    results: List[Optional[str]] = [None] * len(questions)
+    pending: Dict[TargetKind, List[int]] = {}
+    for idx, (question, target) in enumerate(questions):
+        cached = _EXACT_CACHE.get(target, question)
+        if cached is not None:
+            results[idx] = cached
+        else:
+            pending.setdefault(target, []).append(idx)
+
+    if pending:
+        client, llm_cfg = _get_client_and_model()
+        for target, indices in pending.items():
+            numbered = "\n".join(
+                f"{n}. {questions[idx][0]}" for n, idx in enumerate(indices, start=1)
+            )
+            _get_rate_limiter().wait()
+            completion = client.responses.create(  # type: ignore[attr-defined]
+                **_response_request(numbered, target, llm_cfg, _BATCH_SYSTEM_SUFFIX)
+            )
+            queries = _queries_from_batch_completion(completion, len(indices))
+            for idx, query in zip(indices, queries):
+                _remember(questions[idx][0], target, query, None)
+                results[idx] = query
+
+    return [_apply_limit(query, interactive_limit) for query in cast(List[str], results)]
+
+
+async def agenerate_sparql(
+    question: str,
+    target: TargetKind,
+    interactive_limit: int | None = None,
+    client: AsyncOpenAI | None = None,
+) -> str:
+    """
+    Async variant of `generate_sparql` using `openai.AsyncOpenAI`.
+
+    Shares the exact/semantic caches and post-processing with the sync path.
+    If `client` is omitted a client is opened for this call only, since an
+    AsyncOpenAI connection pool cannot outlive the event loop it was used on.
+    """
+
+    cached = _EXACT_CACHE.get(target, question)
+    if cached is not None:
+        return _apply_limit(cached, interactive_limit)
+
+    llm_cfg = load_config().llm
+    if client is not None:
+        return await _agenerate_uncached(question, target, interactive_limit, client, llm_cfg)
+    async with AsyncOpenAI(api_key=_get_api_key(), max_retries=llm_cfg.max_retries) as client:
+        return await _agenerate_uncached(question, target, interactive_limit, client, llm_cfg)
+
+
+async def _agenerate_uncached(
+    question: str,
+    target: TargetKind,
+    interactive_limit: int | None,
+    client: AsyncOpenAI,
+    llm_cfg: LLMConfig,
+) -> str:
+    embedding = None
+    if _get_semantic_cache() is not None:
+        embedding = await _aembed_question(client, llm_cfg, question)
+        cached = _semantic_lookup(target, embedding)
+        if cached is not None:
+            return _apply_limit(cached, interactive_limit)
+
+    await _get_rate_limiter().await_turn()
+    completion = await _astream_completion(client, _response_request(question, target, llm_cfg))
+    query = _query_from_completion(completion)
+    _remember(question, target, query, embedding)
+    return _apply_limit(query, interactive_limit)
+
+
+async def agenerate_sparql_many(
+    requests: Sequence[SparqlRequest],
+    max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+) -> List[str]:
+    """
+    Generate SPARQL for several (question, target, interactive_limit) requests
+    concurrently, with at most `max_concurrent_requests` in flight.
+
+    Results are returned in request order; the first failure is re-raised.
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrent_requests)
+    llm_cfg = load_config().llm
+    async with AsyncOpenAI(api_key=_get_api_key(), max_retries=llm_cfg.max_retries) as client:
+
+        async def _one(request: SparqlRequest) -> str:
+            question, target, interactive_limit = request
+            async with semaphore:
+                return await agenerate_sparql(question, target, interactive_limit, client=client)
+
+        return list(await asyncio.gather(*(_one(r) for r in requests)))
+
+
+def generate_sparql_many(
+    requests: Sequence[SparqlRequest],
+    max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+) -> List[str]:
+    """
+    Generate SPARQL for several (question, target, interactive_limit) requests
+    concurrently from sync code.
+
+    Each request runs `generate_sparql` on a worker thread, so they share the
+    pooled sync client, the streaming keyword guard, the rate limiter and the
+    caches. Results are returned in request order; the first failure is
+    re-raised.
+    """
+
+    if len(requests) <= 1:
+        return [generate_sparql(q, t, limit) for q, t, limit in requests]
+    workers = min(len(requests), max_concurrent_requests)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wobd-nl2sparql") as pool:
+        futures = [pool.submit(generate_sparql, q, t, limit) for q, t, limit in requests]
+        return [future.result() for future in futures]
 
 
 __all__ = [
     "TargetKind",
     "generate_sparql",
+    "agenerate_sparql",
+    "agenerate_sparql_many",
+    "generate_sparql_many",
+    "generate_sparql_batch",
     "set_openai_api_key",
 ]
-
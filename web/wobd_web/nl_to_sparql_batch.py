@@ -0,0 +1,122 @@
+"""
+Offline bulk NL→SPARQL generation via the OpenAI Batch API.
+
+Intended for non-interactive jobs such as regenerating preset variants or
+warming the NL→SPARQL caches: all questions are uploaded as one JSONL file,
+processed asynchronously by OpenAI (at reduced cost and outside the regular
+rate limits), and the results are fed back into the same caches used by
+`generate_sparql`.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from openai.types.responses import Response
+
+from wobd_web.nl_to_sparql import (
+    TargetKind,
+    _embed_questions,
+    _get_client_and_model,
+    _query_from_completion,
+    _remember,
+    _response_request,
+)
+
+
+BATCH_ENDPOINT = "/v1/responses"
+
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def submit_batch(questions: Sequence[Tuple[str, TargetKind]]) -> str:
+    """
+    Submit (question, target) pairs as one Batch API job and return its id.
+
+    Each line uses the same request body as `generate_sparql`; `custom_id` is
+    the index of the question in `questions`.
+    """
+
+    client, llm_cfg = _get_client_and_model()
+    lines = [
+        json.dumps(
+            {
+                "custom_id": str(idx),
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": _response_request(question, target, llm_cfg),
+            }
+        )
+        for idx, (question, target) in enumerate(questions)
+    ]
+    upload = client.files.create(
+        file=("wobd_sparql_batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=upload.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window="24h",
+    )
+    return batch.id
+
+
+def wait_for_batch(
+    batch_id: str,
+    questions: Sequence[Tuple[str, TargetKind]],
+    poll_interval_s: float = 30.0,
+    timeout_s: Optional[float] = None,
+) -> List[Optional[str]]:
+    """
+    Poll a batch submitted with `submit_batch` until it finishes.
+
+    `questions` must be the same sequence passed to `submit_batch`. Returns
+    one SPARQL string per question, in order, or None where the request
+    failed or produced an invalid query. Successful queries are stored in the
+    exact-match cache and, if enabled, the semantic cache.
+    """
+
+    client, llm_cfg = _get_client_and_model()
+    deadline = None if timeout_s is None else time.monotonic() + timeout_s
+    batch = client.batches.retrieve(batch_id)
+    while batch.status not in _TERMINAL_STATUSES:
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(f"Batch {batch_id} still '{batch.status}' after {timeout_s}s.")
+        time.sleep(poll_interval_s)
+        batch = client.batches.retrieve(batch_id)
+
+    results: List[Optional[str]] = [None] * len(questions)
+    if batch.status != "completed" or not batch.output_file_id:
+        return results
+
+    by_index: Dict[int, str] = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            continue
+        try:
+            query = _query_from_completion(Response.model_validate(response["body"]))
+        except (RuntimeError, ValueError, KeyError):
+            continue
+        by_index[int(record["custom_id"])] = query
+
+    indices = sorted(i for i in by_index if 0 <= i < len(questions))
+    embeddings = _embed_questions([questions[i][0] for i in indices], llm_cfg)
+    for pos, idx in enumerate(indices):
+        question, target = questions[idx]
+        embedding = embeddings[pos] if embeddings is not None else None
+        _remember(question, target, by_index[idx], embedding)
+        results[idx] = by_index[idx]
+    return results
+
+
+__all__ = [
+    "BATCH_ENDPOINT",
+    "submit_batch",
+    "wait_for_batch",
+]
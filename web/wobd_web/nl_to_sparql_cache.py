@@ -0,0 +1,266 @@
+"""
+Caches for NL→SPARQL generation.
+
+- ExactSPARQLCache: in-memory LRU keyed by (target, normalized question text).
+- SemanticSPARQLCache: questions are embedded and compared (cosine
+  similarity) against previously answered questions for the same target; a
+  close enough match returns the SPARQL generated earlier instead of calling
+  the LLM again.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class ExactSPARQLCache:
+    """
+    Thread-safe LRU cache of generated SPARQL keyed by target and question.
+
+    Questions are compared with surrounding whitespace stripped and inner
+    runs collapsed. Case is kept: gene symbols such as "Dusp2" (mouse) and
+    "DUSP2" (human) name different genes and get different SPARQL.
+    """
+
+    def __init__(self, maxsize: int = 2048) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+    @staticmethod
+    def _key(target: str, question: str) -> Tuple[str, str]:
+        return target, " ".join(question.split())
+
+    def get(self, target: str, question: str) -> Optional[str]:
+        key = self._key(target, question)
+        with self._lock:
+            sparql = self._entries.get(key)
+            if sparql is not None:
+                self._entries.move_to_end(key)
+            return sparql
+
+    def put(self, target: str, question: str, sparql: str) -> None:
+        key = self._key(target, question)
+        with self._lock:
+            self._entries[key] = sparql
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def normalize_embedding(embedding: Sequence[float]) -> np.ndarray:
+    """Return `embedding` as a unit-length float32 vector."""
+
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else vec
+
+
+@dataclass
+class _Namespace:
+    """Cached entries for a single target, stored as parallel arrays/lists."""
+
+    matrix: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.float32))
+    questions: List[str] = field(default_factory=list)
+    queries: List[str] = field(default_factory=list)
+    expires_at: List[float] = field(default_factory=list)
+
+    def keep(self, mask: np.ndarray) -> None:
+        idx = np.flatnonzero(mask)
+        self.matrix = self.matrix[idx]
+        self.questions = [self.questions[i] for i in idx]
+        self.queries = [self.queries[i] for i in idx]
+        self.expires_at = [self.expires_at[i] for i in idx]
+
+
+# Caches with pending, unsaved entries are flushed when the process exits.
+_PERSISTENT_CACHES: "weakref.WeakSet[SemanticSPARQLCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_persistent_caches() -> None:
+    for cache in list(_PERSISTENT_CACHES):
+        cache.flush()
+
+
+class SemanticSPARQLCache:
+    """
+    Nearest-neighbour cache mapping question embeddings to generated SPARQL.
+
+    Entries are namespaced by target (e.g. "nde" vs "gene_expression") so that
+    prompts for different endpoints never collide, and each entry expires
+    after `ttl_s` seconds. If `path` is given, the cache is loaded from and
+    persisted to that file: embeddings as a NumPy `.npz` archive at `path` and
+    the questions, queries and expiry times in a JSON file next to it. New
+    entries are written at most every `save_interval_s` seconds and on exit.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl_s: float = 86400.0,
+        max_entries: int = 2048,
+        path: Optional[Path] = None,
+        save_interval_s: float = 60.0,
+    ) -> None:
+        self.threshold = threshold
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.path = path
+        self.save_interval_s = save_interval_s
+        self._lock = threading.Lock()
+        # Serialises writers so snapshots reach disk in order.
+        self._save_lock = threading.Lock()
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._dirty = False
+        self._last_save = time.monotonic()
+        if path is not None:
+            self._load()
+            _PERSISTENT_CACHES.add(self)
+
+    def lookup(self, target: str, embedding: np.ndarray) -> Optional[str]:
+        """Return cached SPARQL for the most similar live question, if any."""
+
+        with self._lock:
+            ns = self._namespaces.get(target)
+            if ns is None or not ns.questions or ns.matrix.shape[1] != embedding.shape[0]:
+                return None
+            sims = ns.matrix @ embedding
+            sims[np.asarray(ns.expires_at) <= time.time()] = -np.inf
+            best = int(np.argmax(sims))
+            if sims[best] >= self.threshold:
+                return ns.queries[best]
+            return None
+
+    def add(self, target: str, question: str, embedding: np.ndarray, sparql: str) -> None:
+        """Store the SPARQL generated for `question`, evicting stale entries."""
+
+        with self._lock:
+            ns = self._namespaces.get(target)
+            if ns is None or (ns.questions and ns.matrix.shape[1] != embedding.shape[0]):
+                # New target, or the embedding model changed: start afresh.
+                ns = self._namespaces[target] = _Namespace()
+            if ns.questions:
+                live = np.asarray(ns.expires_at) > time.time()
+                if len(ns.questions) >= self.max_entries:
+                    # Drop the oldest entries to make room.
+                    live[: len(ns.questions) - self.max_entries + 1] = False
+                if not live.all():
+                    ns.keep(live)
+            row = embedding.reshape(1, -1)
+            ns.matrix = np.vstack([ns.matrix, row]) if ns.questions else row.copy()
+            ns.questions.append(question)
+            ns.queries.append(sparql)
+            ns.expires_at.append(time.time() + self.ttl_s)
+            self._dirty = self.path is not None
+            due = self._dirty and time.monotonic() - self._last_save >= self.save_interval_s
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending entries to `path`, if persistence is enabled."""
+
+        if self.path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                # Matrices are replaced rather than mutated, so sharing them
+                # with the snapshot is safe; the lists are copied.
+                snapshot = {
+                    target: (ns.matrix, list(ns.questions), list(ns.queries), list(ns.expires_at))
+                    for target, ns in self._namespaces.items()
+                }
+                self._dirty = False
+                self._last_save = time.monotonic()
+            if not self._save(snapshot):
+                with self._lock:
+                    self._dirty = True
+
+    @property
+    def _meta_path(self) -> Path:
+        assert self.path is not None
+        return self.path.with_name(self.path.name + ".json")
+
+    def _load(self) -> None:
+        assert self.path is not None
+        try:
+            with self._meta_path.open("r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with self.path.open("rb") as f, np.load(f, allow_pickle=False) as arrays:
+                matrices = {name: arrays[name] for name in arrays.files}
+        except (OSError, ValueError, KeyError):
+            return
+        if not isinstance(meta, list):
+            return
+        for i, entry in enumerate(meta):
+            matrix = matrices.get(f"m{i}")
+            if not isinstance(entry, dict) or matrix is None or matrix.ndim != 2:
+                continue
+            questions = entry.get("questions")
+            queries = entry.get("queries")
+            expires_at = entry.get("expires_at")
+            n = matrix.shape[0]
+            if not (
+                isinstance(questions, list)
+                and isinstance(queries, list)
+                and isinstance(expires_at, list)
+                and len(questions) == len(queries) == len(expires_at) == n
+            ):
+                # The two files were written by different saves; skip.
+                continue
+            self._namespaces[str(entry.get("target"))] = _Namespace(
+                matrix=matrix.astype(np.float32, copy=False),
+                questions=[str(q) for q in questions],
+                queries=[str(q) for q in queries],
+                expires_at=[float(t) for t in expires_at],
+            )
+
+    def _save(
+        self,
+        snapshot: Dict[str, Tuple[np.ndarray, List[str], List[str], List[float]]],
+    ) -> bool:
+        assert self.path is not None
+        meta = [
+            {"target": target, "questions": questions, "queries": queries, "expires_at": expires_at}
+            for target, (_, questions, queries, expires_at) in snapshot.items()
+        ]
+        matrices = {f"m{i}": matrix for i, (matrix, *_) in enumerate(snapshot.values())}
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        meta_tmp = self._meta_path.with_name(self._meta_path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write through file objects so NumPy does not append ".npz".
+            with tmp.open("wb") as f:
+                np.savez(f, **matrices)
+            with meta_tmp.open("w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+            os.replace(meta_tmp, self._meta_path)
+        except OSError:
+            # Persistence is best-effort; the in-memory cache stays valid.
+            return False
+        return True
+
+
+__all__ = [
+    "ExactSPARQLCache",
+    "SemanticSPARQLCache",
+    "normalize_embedding",
+]
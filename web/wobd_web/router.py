@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal, Optional
 
-from wobd_web.config import AppConfig, load_config
+from wobd_web.config import AppConfig, load_config, register_reload_hook
 from wobd_web.models import QueryPlan, SourceAction
 from wobd_web.preset_queries import PresetQueryConfig, get_preset_query
 
@@ -26,6 +27,16 @@ def _default_gene_expr_mode(cfg: AppConfig) -> GeneExprMode:
     return "sparql"
 
 
+@lru_cache(maxsize=1)
+def _gene_expr_enabled() -> bool:
+    """Whether gene expression SPARQL endpoints are configured."""
+
+    gene_expr_cfg = load_config().gene_expr
+    if isinstance(gene_expr_cfg, dict):
+        return bool(gene_expr_cfg.get("sparql", {}).get("endpoints"))
+    return False
+
+
 def build_query_plan(question: str) -> QueryPlan:
     """
     Build a QueryPlan for the given natural-language question.
@@ -35,8 +46,17 @@ def build_query_plan(question: str) -> QueryPlan:
 
     - NDE is always included by default (queries NDE data in FRINK).
     - Gene expression is automatically included if configured (via FRINK SPARQL endpoint).
+
+    Plans depend only on the question and the (process-constant) config, so
+    they are cached per stripped question. The returned QueryPlan is shared
+    between callers and must be treated as immutable.
     """
 
+    return _build_query_plan(question.strip())
+
+
+@lru_cache(maxsize=1024)
+def _build_query_plan(question: str) -> QueryPlan:
     # Check for preset query first
     preset = get_preset_query(question)
     if preset is not None:
@@ -66,10 +86,9 @@ def build_query_plan(question: str) -> QueryPlan:
                         )
                     )
         
-        return QueryPlan(actions=actions)
+        return QueryPlan(actions=tuple(actions))
 
     # No preset found - use NL→SPARQL generation (original behavior)
-    cfg = load_config()
     actions = []
 
     # NDE is always on for now.
@@ -83,20 +102,21 @@ def build_query_plan(question: str) -> QueryPlan:
     )
 
     # Gene expression is automatically included if configured (via FRINK SPARQL endpoint)
-    gene_expr_cfg = cfg.gene_expr
-    if isinstance(gene_expr_cfg, dict):
-        sparql_cfg = gene_expr_cfg.get("sparql", {})
-        if sparql_cfg.get("endpoints"):
-            actions.append(
-                SourceAction(
-                    source_id="gene_expression",
-                    kind="gene_expression",
-                    query_text="",  # to be filled by NL→SPARQL
-                    mode="interactive",
-                )
+    if _gene_expr_enabled():
+        actions.append(
+            SourceAction(
+                source_id="gene_expression",
+                kind="gene_expression",
+                query_text="",  # to be filled by NL→SPARQL
+                mode="interactive",
             )
+        )
+
+    return QueryPlan(actions=tuple(actions))
+
 
-    return QueryPlan(actions=actions)
+register_reload_hook(_gene_expr_enabled.cache_clear)
+register_reload_hook(_build_query_plan.cache_clear)
 
 
 __all__ = [
@@ -0,0 +1,175 @@
+"""
+Async SPARQL client for querying several endpoints concurrently.
+
+Federated questions hit NDE, FRINK, Wikidata and other endpoints with the
+same query; issuing the requests together makes the total latency roughly
+that of the slowest endpoint instead of the sum of all of them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from wobd_web.http_settings import HTTP2, HTTP_LIMITS
+from wobd_web.sparql.client import (
+    _GET_FALLBACK_STATUSES,
+    _GET_HEADERS,
+    _POST_HEADERS,
+    USER_AGENT,
+    SourceResult,
+    _decode_sparql_results,
+    _encode_query,
+    execute_sparql,
+)
+
+
+def _new_async_client(timeout_s: float) -> httpx.AsyncClient:
+    # httpx advertises br/zstd in Accept-Encoding itself when their decoders
+    # are installed.
+    return httpx.AsyncClient(
+        http2=HTTP2,
+        limits=HTTP_LIMITS,
+        timeout=timeout_s,
+        headers={"User-Agent": USER_AGENT},
+    )
+
+
+async def execute_sparql_async(
+    client: httpx.AsyncClient,
+    endpoint_url: str,
+    query: str,
+    timeout_s: float = 30.0,
+    method_preference: str = "POST",
+) -> SourceResult:
+    """
+    Async counterpart of `execute_sparql` using the given httpx client.
+
+    Same POST-then-GET behaviour and result shape as the sync client.
+    """
+
+    start_ns = time.monotonic_ns()
+    status = "ok"
+    error: Optional[str] = None
+    rows: List[Dict[str, Any]] = []
+    variables: List[str] = []
+
+    try:
+        resp: Optional[httpx.Response] = None
+
+        if method_preference.upper() == "POST":
+            try:
+                resp = await client.post(
+                    endpoint_url,
+                    content=_encode_query(query),
+                    headers=_POST_HEADERS,
+                    timeout=timeout_s,
+                )
+            except httpx.HTTPError as exc:
+                # Fall through to GET-based attempt below.
+                error = str(exc)
+
+        if resp is None or resp.status_code in _GET_FALLBACK_STATUSES:
+            # Attempt GET as a fallback.
+            try:
+                resp = await client.get(
+                    endpoint_url,
+                    params={"query": query},
+                    headers=_GET_HEADERS,
+                    timeout=timeout_s,
+                )
+            except httpx.HTTPError as exc:
+                return SourceResult(
+                    rows=[],
+                    variables=[],
+                    row_count=0,
+                    elapsed_ms=(time.monotonic_ns() - start_ns) / 1_000_000,
+                    endpoint_url=endpoint_url,
+                    status="error",
+                    error=str(exc),
+                )
+
+        if not resp.is_success:
+            status = "error"
+            error = f"HTTP {resp.status_code}: {resp.text[:500]}"
+        else:
+            try:
+                parsed = _decode_sparql_results(resp.content)
+                if parsed is not None:
+                    rows, variables = parsed
+                else:
+                    status = "error"
+                    error = "Unexpected JSON structure from SPARQL endpoint."
+            except ValueError as exc:
+                status = "error"
+                error = f"Failed to decode JSON from SPARQL endpoint: {exc}"
+    except Exception as exc:  # pragma: no cover - defensive catch
+        status = "error"
+        error = str(exc)
+
+    return SourceResult(
+        rows=rows,
+        variables=variables,
+        row_count=len(rows),
+        elapsed_ms=(time.monotonic_ns() - start_ns) / 1_000_000,
+        endpoint_url=endpoint_url,
+        status=status,
+        error=error,
+    )
+
+
+async def execute_many(
+    endpoint_urls: Sequence[str],
+    query: str,
+    timeout_s: float = 30.0,
+    method_preference: str = "POST",
+) -> List[SourceResult]:
+    """
+    Run `query` against every endpoint concurrently; results keep input order.
+
+    A client (and connection pool) is created per call because httpx async
+    pools are bound to the event loop they were created on.
+    """
+
+    async with _new_async_client(timeout_s) as client:
+        return list(
+            await asyncio.gather(
+                *(
+                    execute_sparql_async(client, url, query, timeout_s, method_preference)
+                    for url in endpoint_urls
+                )
+            )
+        )
+
+
+def execute_sparql_many(
+    endpoint_urls: Sequence[str],
+    query: str,
+    timeout_s: float = 30.0,
+    method_preference: str = "POST",
+) -> List[SourceResult]:
+    """
+    Synchronous wrapper around `execute_many`.
+
+    Falls back to sequential `execute_sparql` calls when invoked from inside
+    a running event loop, where `asyncio.run` is not allowed.
+    """
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(execute_many(endpoint_urls, query, timeout_s, method_preference))
+    return [
+        execute_sparql(url, query, timeout_s=timeout_s, method_preference=method_preference)
+        for url in endpoint_urls
+    ]
+
+
+__all__ = [
+    "execute_sparql_async",
+    "execute_many",
+    "execute_sparql_many",
+]
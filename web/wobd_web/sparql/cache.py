@@ -0,0 +1,99 @@
+"""
+Process-local response cache for SPARQL queries.
+
+SPARQL SELECT queries are idempotent, and the app re-issues the same
+(endpoint, query) pair whenever a question or preset is asked again. Caching
+successful results for a few minutes avoids the network round-trip entirely.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import threading
+from typing import Dict, Tuple
+
+from cachetools import TTLCache
+
+from wobd_web.config import register_reload_hook
+from wobd_web.sparql.client import SourceResult, execute_sparql
+
+
+_LOCK = threading.Lock()
+# One TTLCache per (ttl_s, max_entries) combination in use; guarded by _LOCK.
+_CACHES: Dict[Tuple[float, int], "TTLCache[bytes, SourceResult]"] = {}
+
+
+def _cache_for(ttl_s: float, max_entries: int) -> "TTLCache[bytes, SourceResult]":
+    cache = _CACHES.get((ttl_s, max_entries))
+    if cache is None:
+        cache = _CACHES[(ttl_s, max_entries)] = TTLCache(maxsize=max_entries, ttl=ttl_s)
+    return cache
+
+
+def _key(endpoint_url: str, query: str) -> bytes:
+    digest = hashlib.blake2b(query.encode("utf-8"), digest_size=16).digest()
+    return digest + endpoint_url.encode("utf-8")
+
+
+def _copy(result: SourceResult, **changes: object) -> SourceResult:
+    # Callers may mutate rows, so never hand out the cached lists themselves.
+    return dataclasses.replace(
+        result,
+        rows=[dict(row) for row in result.rows],
+        variables=list(result.variables),
+        columns=(
+            None
+            if result.columns is None
+            else {var: list(column) for var, column in result.columns.items()}
+        ),
+        **changes,
+    )
+
+
+def cached_execute(
+    endpoint_url: str,
+    query: str,
+    timeout_s: float = 30.0,
+    method_preference: str = "POST",
+    ttl_s: float = 300.0,
+    max_entries: int = 512,
+) -> SourceResult:
+    """
+    `execute_sparql` with a TTL + LRU cache keyed by endpoint and query text.
+
+    Only successful results are cached. A hit is returned as a copy with
+    `status="cache"` and `elapsed_ms=0.0`, so provenance shows that no request
+    was made.
+    """
+
+    key = _key(endpoint_url, query)
+    with _LOCK:
+        cached = _cache_for(ttl_s, max_entries).get(key)
+    if cached is not None:
+        return _copy(cached, elapsed_ms=0.0, status="cache")
+
+    result = execute_sparql(
+        endpoint_url, query, timeout_s=timeout_s, method_preference=method_preference
+    )
+    if result.status == "ok":
+        with _LOCK:
+            _cache_for(ttl_s, max_entries)[key] = _copy(result)
+    return result
+
+
+def clear_cache() -> None:
+    """Drop all cached SPARQL results."""
+
+    with _LOCK:
+        _CACHES.clear()
+
+
+# Endpoint URLs or query templates may change with a config reload.
+register_reload_hook(clear_cache)
+
+
+__all__ = [
+    "cached_execute",
+    "clear_cache",
+]
@@ -1,14 +1,44 @@
 from __future__ import annotations
 
+import json
 import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
+try:  # Optional fast JSON decoder (pip install "wobd-web[speedups]").
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+
+try:  # Optional SIMD JSON parser (pip install "wobd-web[speedups]").
+    import simdjson
+except ImportError:  # pragma: no cover - depends on environment
+    simdjson = None  # type: ignore[assignment]
+
+
+try:  # Optional incremental JSON parser for very large result sets.
+    import ijson
+except ImportError:  # pragma: no cover - depends on environment
+    ijson = None  # type: ignore[assignment]
+
+
+# Decoder for SPARQL JSON result bodies (bytes in, Python objects out). Both
+# orjson.JSONDecodeError and json.JSONDecodeError subclass ValueError.
+_JSON_LOADS = orjson.loads if orjson is not None else json.loads
+
+
+@dataclass(slots=True)
 class SourceResult:
     rows: List[Dict[str, Any]]
     variables: List[str]
@@ -17,6 +47,142 @@ class SourceResult:
     endpoint_url: str
     status: str
     error: Optional[str] = None
+    # Column-oriented results (variable -> one value per row, None where
+    # unbound), set instead of `rows` when execute_sparql(columnar=True).
+    columns: Optional[Dict[str, List[Any]]] = None
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """Return rows as dicts, rebuilding them from `columns` if needed."""
+
+        if self.columns is None:
+            return self.rows
+        items = list(self.columns.items())
+        return [
+            {var: column[i] for var, column in items if column[i] is not None}
+            for i in range(self.row_count)
+        ]
+
+
+# Decoded results: per-row dicts, or with `columnar=True` one list per
+# variable; paired with the head variables.
+_Parsed = Tuple[Union[List[Dict[str, Any]], Dict[str, List[Any]]], List[str]]
+
+
+class _ColumnBuilder:
+    """Fill result columns cell by cell when the row count is not known upfront."""
+
+    __slots__ = ("columns", "count")
+
+    def __init__(self, variables: List[str]) -> None:
+        self.columns: Dict[str, List[Any]] = {var: [] for var in variables}
+        self.count = 0
+
+    def put(self, var: str, value: Any) -> None:
+        column = self.columns.get(var)
+        if column is None:
+            # Bound in the results but missing from head.vars.
+            column = self.columns[var] = []
+        if len(column) < self.count:
+            column.extend([None] * (self.count - len(column)))
+        column.append(value)
+
+    def finish(self, variables: List[str]) -> Dict[str, List[Any]]:
+        """Pad every column, including any for `variables`, to the row count."""
+
+        for var in variables:
+            self.columns.setdefault(var, [])
+        for column in self.columns.values():
+            if len(column) < self.count:
+                column.extend([None] * (self.count - len(column)))
+        return self.columns
+
+
+USER_AGENT = "wobd-web/0.1"
+
+# Per-request headers, built once. Accept-Encoding and User-Agent come from the
+# session (or async client) defaults. requests and httpx merge these into a
+# new mapping per request, so sharing the dicts is safe.
+_GET_HEADERS = {"Accept": "application/sparql-results+json"}
+_POST_HEADERS = {**_GET_HEADERS, "Content-Type": "application/sparql-query"}
+
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    # Retry connection failures and gateway errors only; read timeouts are not
+    # retried so a slow query cannot take a multiple of timeout_s.
+    retry = Retry(
+        total=2,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=None,  # SPARQL queries are read-only, so POST is safe too.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "Connection": "keep-alive",
+            # gzip/deflate, plus br (brotli) and zstd when their decoders are
+            # installed, so compressed bodies are always decodable.
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "User-Agent": USER_AGENT,
+        }
+    )
+    return session
+
+
+# Shared session so repeated queries reuse pooled keep-alive connections
+# instead of paying a TCP/TLS handshake per request.
+_SESSION = _new_session()
+
+
+def close_session() -> None:
+    """Close pooled connections (e.g. on app shutdown); a new session is created."""
+
+    global _SESSION
+    _SESSION.close()
+    _SESSION = _new_session()
+
+
+@lru_cache(maxsize=256)
+def _encode_query(query: str) -> bytes:
+    # Preset and cached queries are re-sent verbatim, so reuse their encoding.
+    return query.encode("utf-8")
+
+
+# POST responses that mean "method not supported"; other errors (e.g. 400 for
+# a malformed query) would fail the same way over GET, so are not retried.
+_GET_FALLBACK_STATUSES = frozenset({405, 501})
+
+# Trailing LIMIT of the outer query, optionally followed by OFFSET (solution
+# modifiers may come in either order) and a stray semicolon. Matched against
+# the query with trailing `#` comments removed.
+_TRAILING_LIMIT_RE = re.compile(
+    r"\blimit\s+\d+(?P<offset>\s+offset\s+\d+)?\s*;?\s*\Z", re.IGNORECASE
+)
+# Code at the start of a line, skipping over IRIs and single-line strings so a
+# `#` inside them is not taken for the start of a comment.
+_LINE_CODE_RE = re.compile(
+    r"""(?:[^#<"'\n]|<[^<>"{}|^`\\\s]*>|<|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')*"""
+)
+
+
+def _code_end(query: str) -> int:
+    """Index just past the last character of `query` outside trailing comments."""
+
+    end = len(query)
+    while True:
+        line_start = query.rfind("\n", 0, end) + 1
+        line = query[line_start:end]
+        code_len = _LINE_CODE_RE.match(line).end()
+        if code_len == len(line) or line[code_len] != "#":
+            code_len = len(line)
+        code = line[:code_len].rstrip()
+        if code or line_start == 0:
+            return line_start + len(code)
+        end = line_start - 1
 
 
 def ensure_limit(query: str, max_rows: int) -> str:
@@ -24,17 +190,239 @@ def ensure_limit(query: str, max_rows: int) -> str:
     Ensure that a SPARQL SELECT query has a LIMIT clause with the specified max_rows.
 
     This is a simple, case-insensitive heuristic and does not attempt to fully
-    parse SPARQL. If a LIMIT is already present, it is replaced with the specified
-    max_rows; otherwise a LIMIT is appended.
+    parse SPARQL. Only a LIMIT at the very end of the query (the outer query's
+    solution modifier, optionally followed by OFFSET and `#` comments) is
+    replaced; LIMITs inside sub-SELECTs or comments are left untouched, and if
+    there is no trailing LIMIT one is appended so the response size is always
+    bounded. Trailing comments are kept.
+    """
+
+    limit_clause = f"LIMIT {int(max_rows)}"
+    code_end = _code_end(query)
+    body, comments = query[:code_end], query[code_end:]
+    match = _TRAILING_LIMIT_RE.search(body)
+    if match:
+        offset = match.group("offset") or ""
+        return f"{body[: match.start()]}{limit_clause}{offset}{comments}"
+
+    return f"{body.rstrip(';')}{comments.rstrip()}\n{limit_clause}"
+
+
+def _parse_sparql_json(payload: Dict[str, Any], columnar: bool = False) -> _Parsed:
+    """
+    Flatten a SPARQL JSON results document into (rows, variables).
+
+    Each row maps variable names to the plain `value` of their binding;
+    unbound variables are omitted from the row. With `columnar=True` the
+    values are written straight into one list per variable instead.
     """
 
-    pattern = re.compile(r"\blimit\s+\d+\b", flags=re.IGNORECASE)
-    if pattern.search(query):
-        # Replace existing LIMIT clause
-        return re.sub(r"\blimit\s+\d+\b", f"LIMIT {int(max_rows)}", query, flags=re.IGNORECASE)
+    head = payload.get("head", {})
+    vars_list = head.get("vars") or []
+    if not isinstance(vars_list, list):
+        vars_list = []
+    variables = [sys.intern(str(v)) for v in vars_list]
+
+    results = payload.get("results", {})
+    bindings = results.get("bindings") or []
+    if not isinstance(bindings, list):
+        bindings = []
+
+    if columnar:
+        return _columns_from_bindings(bindings, variables), variables
+
+    rows: List[Dict[str, Any]]
+    try:
+        # Strict fast path: per the SPARQL 1.1 JSON results format every
+        # binding is an object and every bound value a {"type", "value"} object.
+        rows = [
+            {var: value_obj["value"] for var, value_obj in binding.items()}
+            for binding in bindings
+        ]
+    except (AttributeError, KeyError, TypeError):
+        # Malformed or legacy payload: redo it with the permissive per-cell
+        # checks. Decoded JSON only has plain dicts, so `type(...) is dict`
+        # is exact.
+        rows = [
+            _row_from_binding(binding)
+            for binding in bindings
+            if type(binding) is dict
+        ]
+    return rows, variables
+
+
+def _row_from_binding(binding: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        var: value_obj.get("value", value_obj) if type(value_obj) is dict else value_obj
+        for var, value_obj in binding.items()
+    }
+
+
+def _columns_from_bindings(bindings: List[Any], variables: List[str]) -> Dict[str, List[Any]]:
+    bindings = [binding for binding in bindings if type(binding) is dict]
+    n = len(bindings)
+    columns: Dict[str, List[Any]] = {var: [None] * n for var in variables}
+    for i, binding in enumerate(bindings):
+        for var, value_obj in binding.items():
+            column = columns.get(var)
+            if column is None:
+                # Bound in the results but missing from head.vars.
+                column = columns[var] = [None] * n
+            column[i] = value_obj.get("value", value_obj) if type(value_obj) is dict else value_obj
+    return columns
+
 
-    stripped = query.rstrip().rstrip(";")
-    return f"{stripped}\nLIMIT {int(max_rows)}"
+# simdjson parsers reuse their buffers and are not thread-safe, so keep one
+# per thread.
+_SIMDJSON_LOCAL = threading.local()
+
+
+def _simdjson_parser() -> Any:
+    parser = getattr(_SIMDJSON_LOCAL, "parser", None)
+    if parser is None:
+        parser = _SIMDJSON_LOCAL.parser = simdjson.Parser()
+    return parser
+
+
+def _detach(value: Any) -> Any:
+    # Copy simdjson containers out of the parser's buffer before it is reused.
+    if isinstance(value, (simdjson.Object, simdjson.Array)):
+        return value.as_dict() if isinstance(value, simdjson.Object) else value.as_list()
+    return value
+
+
+def _parse_sparql_simdjson(doc: Any, columnar: bool = False) -> _Parsed:
+    """`_parse_sparql_json` over a simdjson document, materialising only the
+    head variables and binding values instead of the whole document."""
+
+    head = doc.get("head")
+    vars_list = head.get("vars") if isinstance(head, simdjson.Object) else None
+    variables = (
+        [sys.intern(str(v)) for v in vars_list]
+        if isinstance(vars_list, simdjson.Array)
+        else []
+    )
+
+    results = doc.get("results")
+    bindings = results.get("bindings") if isinstance(results, simdjson.Object) else None
+
+    # simdjson returns a fresh str per key, so share one object per variable
+    # name across rows.
+    names: Dict[str, str] = {var: var for var in variables}
+    rows: List[Dict[str, Any]] = []
+    columns = _ColumnBuilder(variables) if columnar else None
+    if isinstance(bindings, simdjson.Array):
+        for binding in bindings:
+            if not isinstance(binding, simdjson.Object):
+                continue
+            row: Dict[str, Any] = {}
+            # Index by key: Object.items() would materialise every value.
+            for var in binding:
+                value_obj = binding[var]
+                var = names.setdefault(var, var)
+                if isinstance(value_obj, simdjson.Object) and "value" in value_obj:
+                    value = _detach(value_obj["value"])
+                else:
+                    value = _detach(value_obj)
+                if columns is None:
+                    row[var] = value
+                else:
+                    columns.put(var, value)
+            if columns is None:
+                rows.append(row)
+            else:
+                columns.count += 1
+    if columns is not None:
+        return columns.finish(variables), variables
+    return rows, variables
+
+
+def _decode_sparql_results(content: bytes, columnar: bool = False) -> Optional[_Parsed]:
+    """
+    Decode a SPARQL JSON results body into (rows, variables), or
+    (columns, variables) with `columnar=True`.
+
+    Returns None if the body is valid JSON but not an object, and raises
+    ValueError if it is not valid JSON.
+    """
+
+    if simdjson is not None:
+        try:
+            doc = _simdjson_parser().parse(content)
+        except (RuntimeError, ValueError) as exc:
+            raise ValueError(str(exc)) from exc
+        if not isinstance(doc, simdjson.Object):
+            return None
+        return _parse_sparql_simdjson(doc, columnar)
+
+    payload = _JSON_LOADS(content)
+    if not isinstance(payload, dict):
+        return None
+    return _parse_sparql_json(payload, columnar)
+
+
+_BINDING_PREFIX = "results.bindings.item"
+_SCALAR_EVENTS = frozenset({"string", "number", "boolean", "null"})
+
+
+def _parse_sparql_stream(raw: Any, columnar: bool = False) -> Optional[_Parsed]:
+    """
+    Incrementally parse a SPARQL JSON results stream into (rows, variables).
+
+    Only one binding is held as parsed JSON at a time, so peak memory is the
+    rows themselves rather than the body plus the full document. Same return
+    and error contract as `_decode_sparql_results`.
+    """
+
+    rows: List[Dict[str, Any]] = []
+    variables: List[str] = []
+    columns: Optional[_ColumnBuilder] = None
+    builder: Any = None
+    first = True
+    # Shared string objects for variable names.
+    names: Dict[str, str] = {}
+    try:
+        for prefix, event, value in ijson.parse(raw, use_float=True):
+            if first:
+                if event != "start_map":
+                    return None
+                first = False
+            if builder is not None:
+                if prefix == _BINDING_PREFIX and event == "end_map":
+                    if not columnar:
+                        rows.append(
+                            {
+                                names.setdefault(var, var): (
+                                    v["value"] if isinstance(v, dict) and "value" in v else v
+                                )
+                                for var, v in builder.value.items()
+                            }
+                        )
+                    else:
+                        if columns is None:
+                            columns = _ColumnBuilder(variables)
+                        for var, v in builder.value.items():
+                            columns.put(
+                                names.setdefault(var, var),
+                                v["value"] if isinstance(v, dict) and "value" in v else v,
+                            )
+                        columns.count += 1
+                    builder = None
+                else:
+                    builder.event(event, value)
+            elif prefix == _BINDING_PREFIX and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == "head.vars.item" and event in _SCALAR_EVENTS:
+                name = names[name] = sys.intern(str(value))
+                variables.append(name)
+    except ijson.JSONError as exc:
+        raise ValueError(str(exc)) from exc
+    if columnar:
+        if columns is None:
+            columns = _ColumnBuilder(variables)
+        return columns.finish(variables), variables
+    return rows, variables
 
 
 def execute_sparql(
@@ -42,6 +430,8 @@ def execute_sparql(
     query: str,
     timeout_s: float = 30.0,
     method_preference: str = "POST",
+    streaming: bool = False,
+    columnar: bool = False,
 ) -> SourceResult:
     """
     Execute a SPARQL query against the given endpoint and return a SourceResult.
@@ -49,72 +439,57 @@ def execute_sparql(
     The client prefers HTTP POST with `application/sparql-query`, but will
     fall back to GET with the `query` parameter if POST fails with a method
     error.
+
+    With `streaming=True` (and ijson installed) the response body is parsed
+    incrementally as it arrives instead of being buffered first, which bounds
+    memory for very large result sets.
+
+    With `columnar=True` the decoder writes values straight into
+    `SourceResult.columns` (one list per variable, None where unbound) and
+    leaves `rows` empty; use `SourceResult.to_rows()` where rows are needed.
     """
 
-    headers = {
-        "Accept": "application/sparql-results+json",
-    }
+    streaming = streaming and ijson is not None
 
-    start = time.perf_counter()
+    start_ns = time.monotonic_ns()
     status = "ok"
     error: Optional[str] = None
     rows: List[Dict[str, Any]] = []
     variables: List[str] = []
-
-    def _parse_json(payload: Dict[str, Any]) -> None:
-        nonlocal rows, variables
-        head = payload.get("head", {})
-        vars_list = head.get("vars") or []
-        if not isinstance(vars_list, list):
-            vars_list = []
-        variables = [str(v) for v in vars_list]
-
-        results = payload.get("results", {})
-        bindings = results.get("bindings") or []
-        if not isinstance(bindings, list):
-            bindings = []
-
-        parsed_rows: List[Dict[str, Any]] = []
-        for binding in bindings:
-            if not isinstance(binding, dict):
-                continue
-            row: Dict[str, Any] = {}
-            for var, value_obj in binding.items():
-                if isinstance(value_obj, dict) and "value" in value_obj:
-                    row[var] = value_obj["value"]
-                else:
-                    row[var] = value_obj
-            parsed_rows.append(row)
-        rows = parsed_rows
+    columns: Optional[Dict[str, List[Any]]] = None
 
     try:
         resp: Optional[requests.Response] = None
 
         if method_preference.upper() == "POST":
             try:
-                resp = requests.post(
+                resp = _SESSION.post(
                     endpoint_url,
-                    data=query.encode("utf-8"),
-                    headers={"Content-Type": "application/sparql-query", **headers},
+                    data=_encode_query(query),
+                    headers=_POST_HEADERS,
                     timeout=timeout_s,
+                    stream=streaming,
                 )
             except requests.RequestException as exc:
                 # Fall through to GET-based attempt below.
                 error = str(exc)
 
-        if resp is None or not resp.ok:
+        if resp is None or resp.status_code in _GET_FALLBACK_STATUSES:
+            if resp is not None:
+                resp.close()
             # Attempt GET as a fallback.
             try:
-                resp = requests.get(
+                resp = _SESSION.get(
                     endpoint_url,
                     params={"query": query},
-                    headers=headers,
+                    headers=_GET_HEADERS,
                     timeout=timeout_s,
+                    stream=streaming,
                 )
             except requests.RequestException as exc:
                 status = "error"
                 error = str(exc)
-                elapsed_ms = (time.perf_counter() - start) * 1000.0
+                elapsed_ms = (time.monotonic_ns() - start_ns) / 1_000_000
                 return SourceResult(
                     rows=[],
                     variables=[],
@@ -130,9 +505,19 @@ def execute_sparql(
             error = f"HTTP {resp.status_code}: {resp.text[:500]}"
         else:
             try:
-                payload = resp.json()
-                if isinstance(payload, dict):
-                    _parse_json(payload)
+                if streaming:
+                    # Let urllib3 undo any Content-Encoding as ijson reads.
+                    resp.raw.decode_content = True
+                    with resp:
+                        parsed = _parse_sparql_stream(resp.raw, columnar)
+                else:
+                    parsed = _decode_sparql_results(resp.content, columnar)
+                if parsed is not None:
+                    records, variables = parsed
+                    if columnar:
+                        columns = cast(Dict[str, List[Any]], records)
+                    else:
+                        rows = cast(List[Dict[str, Any]], records)
                 else:
                     status = "error"
                     error = "Unexpected JSON structure from SPARQL endpoint."
@@ -143,8 +528,12 @@ def execute_sparql(
         status = "error"
         error = str(exc)
 
-    elapsed_ms = (time.perf_counter() - start) * 1000.0
-    row_count = len(rows)
+    elapsed_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+    if columns is None:
+        row_count = len(rows)
+    else:
+        # Columns are padded to the same length.
+        row_count = max(map(len, columns.values()), default=0)
 
     return SourceResult(
         rows=rows,
@@ -154,12 +543,38 @@ def execute_sparql(
         endpoint_url=endpoint_url,
         status=status,
         error=error,
+        columns=columns,
     )
 
 
+# Worker threads for execute_sparql_batch; requests releases the GIL while
+# waiting on the network, and all workers share the pooled _SESSION.
+_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="wobd-sparql")
+
+
+def execute_sparql_batch(
+    jobs: Sequence[Tuple[str, str]],
+    timeout_s: float = 30.0,
+) -> List[SourceResult]:
+    """
+    Run several (endpoint_url, query) jobs concurrently from synchronous code.
+
+    Results are returned in the order of `jobs`; total latency is roughly that
+    of the slowest job. See `wobd_web.sparql.async_client` for asyncio callers.
+    """
+
+    futures = [
+        _POOL.submit(execute_sparql, endpoint_url, query, timeout_s)
+        for endpoint_url, query in jobs
+    ]
+    return [future.result() for future in futures]
+
+
 __all__ = [
     "SourceResult",
+    "close_session",
     "ensure_limit",
     "execute_sparql",
+    "execute_sparql_batch",
 ]
 
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
-from wobd_web.config import EndpointConfig, AppConfig, load_config
+from wobd_web.config import EndpointConfig, AppConfig, load_config, register_reload_hook
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Endpoint:
-    """Resolved endpoint with id, label and SPARQL URL."""
+    """Resolved endpoint with id, label and SPARQL URL (immutable)."""
 
     id: str
     label: str
@@ -25,9 +26,10 @@ def get_config() -> AppConfig:
     return load_config()
 
 
-def get_nde_endpoints() -> List[Endpoint]:
+@lru_cache(maxsize=1)
+def get_nde_endpoints() -> Tuple[Endpoint, ...]:
     cfg = get_config()
-    return [_to_endpoint(e) for e in cfg.nde_endpoints]
+    return tuple(_to_endpoint(e) for e in cfg.nde_endpoints)
 
 
 def get_default_nde_endpoint() -> Endpoint:
@@ -37,9 +39,10 @@ def get_default_nde_endpoint() -> Endpoint:
     return endpoints[0]
 
 
-def get_frink_endpoints() -> List[Endpoint]:
+@lru_cache(maxsize=1)
+def get_frink_endpoints() -> Tuple[Endpoint, ...]:
     cfg = get_config()
-    return [_to_endpoint(e) for e in cfg.frink_endpoints]
+    return tuple(_to_endpoint(e) for e in cfg.frink_endpoints)
 
 
 def get_default_frink_endpoint() -> Optional[Endpoint]:
@@ -47,6 +50,7 @@ def get_default_frink_endpoint() -> Optional[Endpoint]:
     return endpoints[0] if endpoints else None
 
 
+@lru_cache(maxsize=None)
 def get_gene_expr_endpoint_for_mode(mode: str) -> Optional[Endpoint]:
     """
     Return the first configured gene-expression endpoint for the given mode.
@@ -80,12 +84,13 @@ def get_gene_expr_endpoint_for_mode(mode: str) -> Optional[Endpoint]:
         return None
 
 
-def get_wikidata_endpoints() -> List[Endpoint]:
+@lru_cache(maxsize=1)
+def get_wikidata_endpoints() -> Tuple[Endpoint, ...]:
     """Get all configured Wikidata endpoints."""
     from wobd_web.config import get_wikidata_endpoints_or_none
     
     endpoints = get_wikidata_endpoints_or_none()
-    return [_to_endpoint(e) for e in endpoints]
+    return tuple(_to_endpoint(e) for e in endpoints)
 
 
 def get_default_wikidata_endpoint() -> Optional[Endpoint]:
@@ -94,12 +99,13 @@ def get_default_wikidata_endpoint() -> Optional[Endpoint]:
     return endpoints[0] if endpoints else None
 
 
-def get_spoke_endpoints() -> List[Endpoint]:
+@lru_cache(maxsize=1)
+def get_spoke_endpoints() -> Tuple[Endpoint, ...]:
     """Get all configured SPOKE endpoints."""
     from wobd_web.config import get_spoke_endpoints_or_none
     
     endpoints = get_spoke_endpoints_or_none()
-    return [_to_endpoint(e) for e in endpoints]
+    return tuple(_to_endpoint(e) for e in endpoints)
 
 
 def get_default_spoke_endpoint() -> Optional[Endpoint]:
@@ -108,12 +114,13 @@ def get_default_spoke_endpoint() -> Optional[Endpoint]:
     return endpoints[0] if endpoints else None
 
 
-def get_ubergraph_endpoints() -> List[Endpoint]:
+@lru_cache(maxsize=1)
+def get_ubergraph_endpoints() -> Tuple[Endpoint, ...]:
     """Get all configured Ubergraph endpoints."""
     from wobd_web.config import get_ubergraph_endpoints_or_none
     
     endpoints = get_ubergraph_endpoints_or_none()
-    return [_to_endpoint(e) for e in endpoints]
+    return tuple(_to_endpoint(e) for e in endpoints)
 
 
 def get_default_ubergraph_endpoint() -> Optional[Endpoint]:
@@ -122,6 +129,26 @@ def get_default_ubergraph_endpoint() -> Optional[Endpoint]:
     return endpoints[0] if endpoints else None
 
 
+_CACHED_GETTERS = (
+    get_nde_endpoints,
+    get_frink_endpoints,
+    get_wikidata_endpoints,
+    get_spoke_endpoints,
+    get_ubergraph_endpoints,
+    get_gene_expr_endpoint_for_mode,
+)
+
+
+def invalidate_endpoint_cache() -> None:
+    """Forget resolved endpoints; they are re-read from config on next use."""
+
+    for getter in _CACHED_GETTERS:
+        getter.cache_clear()
+
+
+register_reload_hook(invalidate_endpoint_cache)
+
+
 __all__ = [
     "Endpoint",
     "get_config",
@@ -136,5 +163,6 @@ __all__ = [
     "get_ubergraph_endpoints",
     "get_default_ubergraph_endpoint",
     "get_gene_expr_endpoint_for_mode",
+    "invalidate_endpoint_cache",
 ]
 